@@ -25,15 +25,31 @@ Classes and Functions:
     operations.
 """
 
+# Keeps the deadline-ordered task index sorted on insert
+import bisect
 # Daytime library for manipulating dates and time
-from datetime import datetime
+from datetime import date, datetime
+# Caches the authorized client and the opened spreadsheet
+from functools import lru_cache, wraps
+# Local snapshot of the sheet data
+import json
 # adding ability to clear console
 import os
+# Jitter for the retry delay between API calls
+import random
+# Pre-compiled pattern for deadline validation
+import re
 import sys
+# Monotonic clock for the age of the cached sheet data
+import time
 # Google Auth service for importing Credentials
 from google.oauth2.service_account import Credentials
+# Authorized requests session shared by all gspread calls
+from google.auth.transport.requests import AuthorizedSession
+from requests.adapters import HTTPAdapter
 # Google gspread service for handling APIErrors
 from gspread.exceptions import APIError
+from gspread.utils import absolute_range_name, fill_gaps, rowcol_to_a1
 import gspread
 
 # Import colorama for console colorization
@@ -45,23 +61,189 @@ SCOPE = [
     "https://www.googleapis.com/auth/drive"
 ]
 
-CREDS = Credentials.from_service_account_file('creds.json')
-SCOPED_CREDS = CREDS.with_scopes(SCOPE)
-GSPREAD_CLIENT = gspread.authorize(SCOPED_CREDS)
-SHEET = GSPREAD_CLIENT.open('Python Task Manager')
 
-task_list = SHEET.worksheet('tasks')
-projects = SHEET.worksheet('project')
-categories = SHEET.worksheet('category')
+# HTTP statuses worth retrying: quota exceeded and transient server errors
+_RETRY_STATUSES = frozenset({429, 500, 503})
+# Appends are not idempotent: a server error may arrive after the row was
+# written, so only a rejected (quota) request is safe to send again
+_APPEND_RETRY_STATUSES = frozenset({429})
+_MAX_ATTEMPTS = 6
+
+
+def with_backoff(func=None, *, statuses=_RETRY_STATUSES):
+    """
+    Retry a Google Sheets call on the given HTTP error statuses (quota or
+    transient server errors by default), with exponential backoff plus
+    random jitter between attempts. Use as @with_backoff, or as
+    @with_backoff(statuses=...) to retry on other statuses.
+    """
+    if func is None:
+        return lambda func: with_backoff(func, statuses=statuses)
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        delay = 0.5
+        for attempt in range(1, _MAX_ATTEMPTS + 1):
+            try:
+                return func(*args, **kwargs)
+            except APIError as e:
+                if (e.response.status_code not in statuses
+                        or attempt == _MAX_ATTEMPTS):
+                    raise
+            time.sleep(delay + random.random() * 0.25)
+            delay *= 2
+    return wrapper
+
+
+@lru_cache(maxsize=1)
+def get_client():
+    """
+    Authorize the gspread client once, on first use rather than on import.
+    All requests go through one pooled session so the TCP/TLS connection
+    to the Sheets API is reused between calls.
+    """
+    creds = Credentials.from_service_account_file(
+        'creds.json').with_scopes(SCOPE)
+    session = AuthorizedSession(creds)
+    session.mount(
+        "https://", HTTPAdapter(pool_connections=1, pool_maxsize=4))
+    return gspread.Client(auth=creds, session=session)
+
+
+@lru_cache(maxsize=1)
+@with_backoff
+def get_sheet():
+    """Open the Task Manager spreadsheet once and reuse the handle."""
+    return get_client().open('Python Task Manager')
+
+
+@lru_cache(maxsize=1)
+@with_backoff
+def get_worksheets():
+    """
+    Fetch every worksheet handle with a single metadata request and index
+    them by title, instead of one request per worksheet() lookup.
+    """
+    return {worksheet.title: worksheet
+            for worksheet in get_sheet().worksheets()}
+
+
+def get_worksheet(title):
+    """Look up a worksheet by title from the cached handles."""
+    return get_worksheets()[title]
+
 
 CONSOLE_WIDTH = 79  # Force fixed width for Heroku console
 
+# Seconds the cached sheet data stays fresh before it is re-fetched
+CACHE_TTL = 60
+
+# Sheet data from the last fetch, reused by the next run while fresh
+CACHE_FILE = os.path.join(
+    os.path.expanduser("~"), ".cache", "task_manager", "snapshot.json")
+
+# Allowed values for task priority and status
+_VALID_PRIORITIES = frozenset({"High", "Medium", "Low"})
+_VALID_STATUSES = frozenset({"Pending", "In Progress", "Completed"})
+# YYYY-MM-DD deadline, matched before building the date from its parts
+_DATE_RE = re.compile(r"(\d{4})-(\d{2})-(\d{2})")
+# Sort rank for each priority, used by the priority view
+_PRIORITY_ORDER = {"High": 1, "Medium": 2, "Low": 3, "": 4}
+
+# Prompts and messages reused by the input retry loops
+_NAME_PROMPT = "Enter task name: "
+_DEADLINE_PROMPT = "Enter task deadline (YYYY-MM-DD): "
+_PRIORITY_PROMPT = "Enter task priority (High, Medium, Low): "
+_NEW_DEADLINE_PROMPT = "Enter the new deadline (YYYY-MM-DD): "
+_NEW_PRIORITY_PROMPT = "Enter the new priority (High, Medium, Low): "
+_NEW_STATUS_PROMPT = "Enter the new status (Pending, In Progress, Completed): "
+_UPDATE_OPTIONS = [
+    "\n What would you like to update?",
+    "1 - Task Name",
+    "2 - Deadline",
+    "3 - Priority",
+    "4 - Notes",
+    "5 - Status",
+    "6 - Category",
+    "7 - Project",
+]
+_INVALID_STATUS_MESSAGE = (
+    "Invalid status. Please choose from Pending, In Progress, or Completed.")
+
+
+# Today's date as YYYY-MM-DD, reformatted only when the day changes
+_TODAY = {"date": None, "str": None}
+
+
+def today_str():
+    """Return today's date as a YYYY-MM-DD string."""
+    today = date.today()
+    if _TODAY["date"] != today:
+        _TODAY["date"] = today
+        _TODAY["str"] = today.isoformat()
+    return _TODAY["str"]
+
+
+def read_disk_cache():
+    """
+    Return (age in seconds, [tasks, projects, categories]) from the local
+    snapshot, or None if it is missing, unreadable or older than CACHE_TTL.
+    """
+    try:
+        age = time.time() - os.path.getmtime(CACHE_FILE)
+        if age >= CACHE_TTL:
+            return None
+        with open(CACHE_FILE, encoding="utf-8") as cache_file:
+            data = json.load(cache_file)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(data, list) or len(data) != 3:
+        return None
+    return age, data
+
+
+def write_disk_cache(data):
+    """
+    Save the sheet data as the local snapshot. The file is written aside
+    and swapped in so a reader never sees a partial snapshot.
+    """
+    temp_file = CACHE_FILE + ".tmp"
+    try:
+        os.makedirs(os.path.dirname(CACHE_FILE), exist_ok=True)
+        with open(temp_file, "w", encoding="utf-8") as cache_file:
+            json.dump(data, cache_file)
+        os.replace(temp_file, CACHE_FILE)
+    except OSError:
+        pass  # The snapshot is only a shortcut; the sheets stay the source
+
+
+def clear_disk_cache():
+    """Drop the local snapshot before a write makes it outdated."""
+    try:
+        os.remove(CACHE_FILE)
+    except OSError:
+        pass
+
+
+def write_lines(lines):
+    """
+    Write a list of lines to the console in one call instead of one
+    print() per line.
+    """
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
+
 
 class Task:
     """
     Represents an individual task with related attributes and methods.
     """
 
+    # Fixed attribute set: avoids a per-instance __dict__ for every row
+    __slots__ = ('task_id', 'name', 'deadline', 'priority', 'status',
+                 'notes', 'category', 'project', 'complete_date',
+                 'create_date')
+
     def __init__(self,
                  task_id,
                  name,
@@ -86,7 +268,7 @@ class Task:
     def mark_as_completed(self):
         """Marks the task as completed and sets the completion date."""
         self.status = "Completed"
-        self.complete_date = datetime.now().strftime("%Y-%m-%d")
+        self.complete_date = today_str()
 
     def update(self, **kwargs):
         """Dynamically updates attributes of the task."""
@@ -106,6 +288,18 @@ class Task:
         )
 
 
+def _deadline_key(task):
+    """
+    Sort key for the deadline-ordered task index: the deadline as a
+    YYYY-MM-DD string, which sorts chronologically without parsing.
+    Legacy DD-MM-YYYY values are rearranged by slicing.
+    """
+    deadline = task.deadline
+    if deadline[2:3] == "-":
+        return f"{deadline[6:10]}-{deadline[3:5]}-{deadline[0:2]}"
+    return deadline
+
+
 class TaskManager:
     """
     Manages tasks and their interactions with the Task class and Google Sheets.
@@ -121,10 +315,24 @@ class TaskManager:
         self.cached_projects = []  # For storing project data
         self.cached_categories = []  # For storing category data
 
-        # Load and cache data from Google Sheets
-        self.load_and_cache_data()
+        # Lookups built from the cached data: ID -> name
+        self._project_names = {}
+        self._category_names = {}
+        # ID -> {"id", "name"} dict shared by every task in that
+        # category/project
+        self._category_refs = {}
+        self._project_refs = {}
+        # Option lists shown before the category/project prompts
+        self._project_options = ""
+        self._category_options = ""
+        # time.monotonic() of the last fetch, used to expire the cache
+        self._loaded_at = 0.0
+
+        # Load and cache data from Google Sheets, or from the local snapshot
+        # left by a recent run
+        self.load_and_cache_data(use_disk_cache=True)
         # Load tasks into memory as Task objects
-        self.task_list = self.load_tasks()
+        self.reload_tasks()
 
     def clear_console(self):
         """Clears the console screen."""
@@ -133,28 +341,116 @@ class TaskManager:
         else:
             os.system('clear')  # macOS/Linux
 
-    def load_and_cache_data(self):
+    def load_and_cache_data(self, use_disk_cache=False):
         """
-        Fetch and cache task, project, and category data from Google Sheets.
+        Fetch and cache task, project, and category data from Google Sheets,
+        or from the local snapshot if use_disk_cache is set and it is still
+        fresh. Returns False if the fetch failed, in which case the previous
+        data and lookups (empty on the first load) are kept.
+        """
+        snapshot = read_disk_cache() if use_disk_cache else None
+        if snapshot:
+            age, (self.cached_tasks,
+                  self.cached_projects,
+                  self.cached_categories) = snapshot
+            # Expire when the data fetched by the earlier run would have
+            self._loaded_at = time.monotonic() - age
+            print("Data loaded from local cache.")
+        else:
+            print("Loading and caching data from Google Sheets...")
+            if not self._fetch_from_sheets():
+                return False
+
+        # Build ID -> name lookups once so validation needs no API calls
+        self._project_names = {
+            row[0]: row[1] for row in self.cached_projects[1:]}  # Skip header
+        self._category_names = {
+            row[0]: row[1] for row in self.cached_categories[1:]}
+        # Names may have changed, so drop the shared task references
+        self._category_refs = {}
+        self._project_refs = {}
+        # Format the option lists once per load rather than per prompt
+        self._project_options = self.format_options(self._project_names)
+        self._category_options = self.format_options(self._category_names)
+        return True
+
+    def _fetch_from_sheets(self):
+        """
+        Fetch task, project and category data from Google Sheets and save
+        it as the local snapshot. Returns True on success.
         """
-        print("Loading and caching data from Google Sheets...")
-
         try:
-            # Fetch and cache task data
-            self.cached_tasks = self.tasks_sheet.get_all_values()
-
-            # Fetch and cache project data
-            self.cached_projects = self.projects_sheet.get_all_values()
-
-            # Fetch and cache category data
-            self.cached_categories = self.categories_sheet.get_all_values()
+            # Fetch task, project and category data in one batchGet request
+            # instead of a separate round-trip per worksheet. Only the ten
+            # task columns (A:J) and the ID and name columns (A:B) of
+            # projects and categories are used
+            response = self._batch_get([
+                absolute_range_name(self.tasks_sheet.title, "A:J"),
+                absolute_range_name(self.projects_sheet.title, "A:B"),
+                absolute_range_name(self.categories_sheet.title, "A:B"),
+            ])
+            # Pad ragged rows to the full range width, so trailing empty
+            # cells (e.g. no notes) still have an index
+            (self.cached_tasks,
+             self.cached_projects,
+             self.cached_categories) = [
+                fill_gaps(value_range.get("values", [[]]), cols=cols)
+                for value_range, cols in zip(response["valueRanges"],
+                                             (10, 2, 2))
+            ]
 
+            self._loaded_at = time.monotonic()
+            write_disk_cache([self.cached_tasks,
+                              self.cached_projects,
+                              self.cached_categories])
             print("Data successfully loaded and cached!")
+            return True
         except APIError as e:
+            # Leave the cached data and _loaded_at untouched, so a stale
+            # snapshot stays usable and the next action retries the fetch
             print(f"Error while loading data: {e}")
-            self.cached_tasks = []
-            self.cached_projects = []
-            self.cached_categories = []
+            return False
+
+    # Thin wrappers around the Google Sheets calls, retried on quota errors
+    @with_backoff
+    def _batch_get(self, ranges):
+        """Fetch several ranges of the spreadsheet in one request."""
+        return self.tasks_sheet.spreadsheet.values_batch_get(ranges)
+
+    @with_backoff(statuses=_APPEND_RETRY_STATUSES)
+    def _append_rows(self, rows, **kwargs):
+        """Append rows to the tasks sheet."""
+        clear_disk_cache()
+        return self.tasks_sheet.append_rows(rows, **kwargs)
+
+    @with_backoff
+    def _update_cell(self, row, col, value):
+        """Write a single cell of the tasks sheet."""
+        clear_disk_cache()
+        return self.tasks_sheet.update_cell(row, col, value)
+
+    @with_backoff
+    def _batch_update(self, data, **kwargs):
+        """Write several ranges of the tasks sheet in one request."""
+        clear_disk_cache()
+        return self.tasks_sheet.batch_update(data, **kwargs)
+
+    def refresh_data(self):
+        """
+        Re-fetch all data from Google Sheets and rebuild the in-memory tasks,
+        lookups and option lists. If the fetch fails, the current data is
+        kept.
+        """
+        if self.load_and_cache_data():
+            self.reload_tasks()
+
+    def refresh_if_stale(self):
+        """
+        Re-fetch the cached data only if it is older than CACHE_TTL seconds,
+        so repeated menu actions reuse one snapshot of the sheets.
+        """
+        if time.monotonic() - self._loaded_at >= CACHE_TTL:
+            self.refresh_data()
 
     # Helper methods for data validation
     def validate_task_name(self, name):
@@ -171,12 +467,16 @@ class TaskManager:
         Validates the task deadline to ensure it is in the correct date format
         (YYYY-MM-DD) and not set in the past.
         """
+        match = _DATE_RE.fullmatch(deadline)
+        if not match:
+            return "Invalid deadline format. Please use YYYY-MM-DD."
         try:
-            deadline_date = datetime.strptime(deadline, "%Y-%m-%d")
-            if deadline_date < datetime.now():
-                return "Deadline cannot be in the past."
+            # Only out-of-range parts (e.g. month 13) can still fail here
+            deadline_date = datetime(*map(int, match.groups()))
         except ValueError:
             return "Invalid deadline format. Please use YYYY-MM-DD."
+        if deadline_date < datetime.now():
+            return "Deadline cannot be in the past."
         return None
 
     def validate_priority(self, priority):
@@ -184,8 +484,7 @@ class TaskManager:
         Validates the task priority to ensure it is one of the allowed values:
         'High', 'Medium', or 'Low'.
         """
-        valid_priorities = ["High", "Medium", "Low"]
-        if priority not in valid_priorities:
+        if priority not in _VALID_PRIORITIES:
             return "Invalid priority. Please choose from High, Medium, or Low."
         return None
 
@@ -195,14 +494,20 @@ class TaskManager:
         categories
         retrieved from the categories sheet.
         """
-        # Skip header row
-        category_ids = [
-            row[0] for row in self.categories_sheet.get_all_values()[1:]]
-        if category_id not in category_ids:
+        if category_id not in self._category_names:
             return "Invalid category ID. Please choose from " \
                 "the available categories."
         return None
 
+    def _validate_project(self, project_id):
+        """
+        Validates the project ID against the cached project data.
+        """
+        if project_id not in self._project_names:
+            return "Invalid project ID. Please choose " \
+                "from the available projects."
+        return None
+
     def validate_project_id(self,
                             project_id,
                             name=None,
@@ -213,104 +518,109 @@ class TaskManager:
         Validates various aspects of a task, including project ID,
         task name, deadline, priority, and category ID.
         """
-
-        # Fetch valid project IDs and category IDs
-        project_ids = [row[0] for row in self.projects_sheet.get_all_values()[
-            1:]]  # Skip header row
-        category_ids = [row[0] for row in
-                        self.categories_sheet.get_all_values()[
-            1:]]  # Skip header row
-
-        # Validate project ID
-        if project_id not in project_ids:
-            return "Invalid project ID. Please choose " \
-                "from the available projects."
-
-        # Validate name if provided
-        if name is not None:
-            if not name.strip() or len(name) > 50:
-                return "Task name must be non-empty and 50 characters or less."
-
-        # Validate deadline if provided
-        if deadline is not None:
-            try:
-                deadline_date = datetime.strptime(deadline, "%Y-%m-%d")
-                if deadline_date < datetime.now():
-                    return "Deadline cannot be in the past."
-            except ValueError:
-                return "Invalid deadline format. Please use YYYY-MM-DD."
-
-        # Validate priority if provided
-        if priority is not None:
-            valid_priorities = ["High", "Medium", "Low"]
-            if priority not in valid_priorities:
-                return "Invalid priority. Please choose " \
-                    "from High, Medium, or Low."
-
-        # Validate category ID if provided
-        if category_id is not None:
-            if category_id not in category_ids:
-                return "Invalid category ID."
+        # Run each validator in turn; optional fields are only checked
+        # when provided
+        checks = (
+            (project_id, self._validate_project),
+            (name, self.validate_task_name),
+            (deadline, self.validate_deadline),
+            (priority, self.validate_priority),
+            (category_id, self.validate_category_id),
+        )
+        for value, validator in checks:
+            if value is not None:
+                error = validator(value)
+                if error:
+                    return error
 
         # If all validations pass
         return None
 
+    def format_options(self, names):
+        """
+        Format an ID -> name lookup as one 'ID: x, Name: y' line per entry.
+        """
+        return "\n".join(
+            f"ID: {item_id}, Name: {name}" for item_id, name in names.items())
+
     def get_project_name(self, project_id):
         """
         Fetches the project name corresponding to a given project ID.
         """
-        # Use cached project data
-        project_dict = {row[0]: row[1]
-                        for row in self.cached_projects[1:]}  # Skip header
-        return project_dict.get(project_id, "none")
+        return self._project_names.get(project_id, "none")
 
     def get_category_name(self, category_id):
         """
         Fetches the category name corresponding to a given category ID
         from cached data.
         """
-        # Use cached category data
-        category_dict = {row[0]: row[1]
-                         for row in self.cached_categories[1:]}  # Skip header
-        return category_dict.get(category_id, "Unknown Category")
+        return self._category_names.get(category_id, "Unknown Category")
+
+    def get_category_ref(self, category_id):
+        """
+        Return the {"id", "name"} dict for a category ID. One dict is
+        shared by all tasks in the category instead of one per task.
+        """
+        ref = self._category_refs.get(category_id)
+        if ref is None:
+            ref = self._category_refs[category_id] = {
+                "id": category_id,
+                "name": self.get_category_name(category_id)}
+        return ref
+
+    def get_project_ref(self, project_id):
+        """
+        Return the {"id", "name"} dict for a project ID. One dict is
+        shared by all tasks in the project instead of one per task.
+        """
+        ref = self._project_refs.get(project_id)
+        if ref is None:
+            ref = self._project_refs[project_id] = {
+                "id": project_id,
+                "name": self.get_project_name(project_id)}
+        return ref
 
     def load_tasks(self):
         """
         Load tasks from cached data into Task objects.
         """
-        task_data = self.cached_tasks[1:]  # Skip header row
-        project_dict = {row[0]: row[1]
-                        for row in self.cached_projects[1:]}  # Skip header
-        category_dict = {row[0]: row[1]
-                         for row in self.cached_categories[1:]}  # Skip header
-
-        loaded_tasks = []
-
-        for row in task_data:
-            loaded_tasks.append(Task(
-                task_id=row[0],
-                name=row[1],
-                deadline=row[3],
-                priority=row[6],
-                status=row[5],
-                notes=row[9],
-                category={"id": row[7], "name": category_dict.get(
-                    row[7], "Unknown Category")},
-                project={"id": row[8], "name": project_dict.get(
-                    row[8], "none")}
-            ))
-
-        return loaded_tasks
+        category_ref = self.get_category_ref
+        project_ref = self.get_project_ref
+
+        # Columns: 0 ID, 1 name, 3 deadline, 5 status, 6 priority,
+        # 7 category, 8 project, 9 notes
+        return [
+            Task(row[0], row[1], row[3], row[6], row[5], row[9],
+                 category_ref(row[7]), project_ref(row[8]))
+            for row in self.cached_tasks[1:]  # Skip header row
+        ]
+
+    def reload_tasks(self):
+        """
+        Rebuild the in-memory Task objects and the indexes derived from them.
+        """
+        self.task_list = self.load_tasks()
+        # Tasks ordered by deadline, kept sorted on add/update so the
+        # deadline view does not need to re-sort every time
+        self._by_deadline = sorted(self.task_list, key=_deadline_key)
+        # Next task ID, bumped on every add instead of rescanning all tasks
+        self._next_id = max(
+            (int(task.task_id) for task in self.task_list
+             if task.task_id.isdigit()), default=0) + 1
+        # Task ID -> Task and task ID -> 1-based sheet row, for O(1)
+        # lookups when the user picks a task
+        self._tasks_by_id = {task.task_id: task for task in self.task_list}
+        self._task_rows = {
+            row[0]: index
+            for index, row in enumerate(self.cached_tasks[1:], start=2)}
 
     def generate_unique_task_id(self):
         """
-        Generate the next sequential task ID based on the highest
-        existing task ID.
+        Generate the next sequential task ID from the running counter,
+        which starts one above the highest existing task ID.
         """
-        existing_ids = [int(task.task_id)
-                        for task in self.task_list if task.task_id.isdigit()]
-        # If there are no existing IDs, start with 1
-        next_id = max(existing_ids, default=0) + 1
+        next_id = self._next_id
+        self._next_id += 1
         return str(next_id)
 
     def add_task(self,
@@ -326,11 +636,13 @@ class TaskManager:
         """
         # Use the current date if create_date is not provided
         if create_date is None:
-            create_date = datetime.now().strftime("%Y-%m-%d")
+            create_date = today_str()
 
-        # Fetch category and project names
-        category_name = self.get_category_name(category_id)
-        project_name = self.get_project_name(project_id)
+        # Fetch the shared category and project references
+        category = self.get_category_ref(category_id)
+        project = self.get_project_ref(project_id)
+        category_name = category["name"]
+        project_name = project["name"]
 
         # Generate a unique task ID
         new_task_id = self.generate_unique_task_id()
@@ -344,29 +656,57 @@ class TaskManager:
             status="Pending",  # Default status
             notes=notes,
             create_date=create_date,
-            category={"id": category_id, "name": category_name},
-            project={"id": project_id, "name": project_name}
+            category=category,
+            project=project
         )
 
-        # Add the new task to the task list
-        self.task_list.append(new_task)
-
         # Sync with Google Sheets or other storage
-        self.tasks_sheet.append_row([
-            new_task.task_id,
-            new_task.name,
-            new_task.create_date,
-            new_task.deadline,
-            "",
-            new_task.status,
-            new_task.priority,
-            new_task.category["id"],
-            new_task.project["id"],
-            new_task.notes
-        ])
-        print(f"Task '{name}' added successfully with ID {new_task_id}, "
-              f"Category '{category_name}', Project '{project_name}', \
-                and Create Date '{create_date}'.")
+        if self.add_tasks([new_task]):
+            print(f"Task '{name}' added successfully with ID {new_task_id}, "
+                  f"Category '{category_name}', Project '{project_name}', "
+                  f"and Create Date '{create_date}'.")
+
+    def add_tasks(self, new_tasks):
+        """
+        Append new Task objects to Google Sheets in a single request and,
+        once written, to the in-memory task list and indexes.
+        Returns True on success.
+        """
+        new_rows = [
+            [task.task_id,
+             task.name,
+             task.create_date,
+             task.deadline,
+             "",
+             task.status,
+             task.priority,
+             task.category["id"],
+             task.project["id"],
+             task.notes]
+            for task in new_tasks
+        ]
+        try:
+            # Single values.append call anchored at A1, without echoing the
+            # written values back
+            self._append_rows(
+                new_rows, table_range="A1", include_values_in_response=False)
+        except APIError as e:
+            # Leave the in-memory tasks untouched. The allocated IDs are not
+            # handed out again: a gap in the sequence is harmless, a
+            # duplicate ID is not
+            print(f"Error while adding tasks: {e}")
+            return False
+
+        for task, row in zip(new_tasks, new_rows):
+            # Add the new task to the task list
+            self.task_list.append(task)
+            bisect.insort(self._by_deadline, task, key=_deadline_key)
+            self._tasks_by_id[task.task_id] = task
+            # Mirror the appended row so the cached data and row index match
+            # the sheet
+            self.cached_tasks.append(row)
+            self._task_rows[task.task_id] = len(self.cached_tasks)
+        return True
 
     def create_task_from_input(self):
         """
@@ -375,7 +715,7 @@ class TaskManager:
         """
         # Prompt for task name
         while True:
-            name = input("Enter task name: ").strip()
+            name = input(_NAME_PROMPT).strip()
             error = self.validate_task_name(name)
             if error:
                 print(f"Error: {error}")
@@ -384,7 +724,7 @@ class TaskManager:
 
         # Prompt for task deadline
         while True:
-            deadline = input("Enter task deadline (YYYY-MM-DD): ").strip()
+            deadline = input(_DEADLINE_PROMPT).strip()
             error = self.validate_deadline(deadline)
             if error:
                 print(f"Error: {error}")
@@ -393,9 +733,7 @@ class TaskManager:
 
         # Prompt for task priority
         while True:
-            priority = input(
-                "Enter task priority "
-                "(High, Medium, Low): ").strip().capitalize()
+            priority = input(_PRIORITY_PROMPT).strip().capitalize()
             error = self.validate_priority(priority)
             if error:
                 print(f"Error: {error}")
@@ -404,10 +742,7 @@ class TaskManager:
 
         # Display category options and prompt for selection
         print("Available categories:")
-        category_data = self.categories_sheet.get_all_values()[
-            1:]  # Skip header row
-        for row in category_data:
-            print(f"ID: {row[0]}, Name: {row[1]}")
+        print(self._category_options)
         while True:
             category_id = input("Enter category ID: ").strip()
             error = self.validate_category_id(category_id)
@@ -418,10 +753,7 @@ class TaskManager:
 
         # Display project options and prompt for selection
         print("Available projects:")
-        project_date = self.projects_sheet.get_all_values()[
-            1:]  # Skip header row
-        for row in project_date:
-            print(f"ID: {row[0]}, Name: {row[1]}")
+        print(self._project_options)
         while True:
             project_id = input("Enter project ID: ").strip()
             error = self.validate_project_id(project_id)
@@ -434,7 +766,7 @@ class TaskManager:
         notes = input("Enter additional notes (optional): ").strip()
 
         # Automatically add the current date as the create date
-        create_date = datetime.now().strftime("%Y-%m-%d")
+        create_date = today_str()
 
         # Add the task
         self.add_task(name, deadline, priority, category_id,
@@ -449,25 +781,24 @@ class TaskManager:
             print("No tasks found.")
             return
 
-        # Filter out tasks with the status 'Deleted'
-        visible_tasks = [
+        # Filter out tasks with the status 'Deleted' lazily; the sort below
+        # builds the only list
+        visible_tasks = (
             task for task
-            in self.task_list if task.status.lower() != "deleted"]
-
-        if not visible_tasks:
-            print("No tasks available to display. all are marked as 'Deleted'")
-            return
+            in self.task_list if task.status.lower() != "deleted")
 
         # Determine the sorting key
         if sort_by == "priority":
-            priority_order = {"High": 1, "Medium": 2, "Low": 3, "": 4}
             sorted_tasks = sorted(
-                visible_tasks, key=lambda task: priority_order.get(
+                visible_tasks, key=lambda task: _PRIORITY_ORDER.get(
                     task.priority, 5)
             )
         elif sort_by == "deadline":
-            sorted_tasks = sorted(
-                visible_tasks, key=lambda task: task.deadline or "")
+            # Already ordered by deadline, only filter out deleted tasks
+            # while the rows are formatted
+            sorted_tasks = (
+                task for task in self._by_deadline
+                if task.status.lower() != "deleted")
         elif sort_by == "status":
             sorted_tasks = sorted(
                 visible_tasks, key=lambda task: task.status.lower())
@@ -509,11 +840,13 @@ class TaskManager:
             f"{headers[4]:<{column_widths['Project'] + 1}}"
             f"{headers[5]:<{column_widths['Name']}}"
         )
-        # Print the header with enforced left alignment and styling
-        print(Style.BRIGHT + Fore.BLUE + header_row + Style.RESET_ALL)
-        print("-" * CONSOLE_WIDTH)
+        # Collect the table lines and write them out in one call rather
+        # than printing row by row
+        # Header with enforced left alignment and styling
+        lines = [Style.BRIGHT + Fore.BLUE + header_row + Style.RESET_ALL,
+                 "-" * CONSOLE_WIDTH]
 
-        # Print each task as a row in the table
+        # Format each task as a row in the table
         for task in sorted_tasks:
             # Ensure each value fits within the column widths
             task_id_display = f"{task.task_id:<{column_widths['ID']}}"
@@ -549,12 +882,19 @@ class TaskManager:
                 priority_width = column_widths["Priority"]
                 priority_display = f"{task.priority:<{priority_width}}"
 
-            # Print the formatted row
-            print(
+            # Add the formatted row
+            lines.append(
                 f"{task_id_display} {deadline_display} {priority_display}"
                 f"{status_display} {project_display} {name_display}"
             )
 
+        # Only the header and separator: every task is marked as deleted
+        if len(lines) == 2:
+            print("No tasks available to display. all are marked as 'Deleted'")
+            return
+
+        write_lines(lines)
+
     def update_task(self):
         """
         Update an existing task by modifying its attributes.
@@ -573,22 +913,16 @@ class TaskManager:
         while True:
             task_id = input(
                 "Enter the ID of the task you want to update: ").strip()
-            task = next((t for t in self.task_list if str(
-                t.task_id) == task_id), None)
+            task = self._tasks_by_id.get(task_id)
             if not task:
                 print("Task ID not found. Please try again.")
             else:
                 break
+        # Sheet row of the selected task
+        task_row = self._task_rows[task.task_id]
 
         # Show update options
-        print("\n What would you like to update?")
-        print("1 - Task Name")
-        print("2 - Deadline")
-        print("3 - Priority")
-        print("4 - Notes")
-        print("5 - Status")
-        print("6 - Category")
-        print("7 - Project")
+        write_lines(_UPDATE_OPTIONS)
 
         # Main update loop
         while True:
@@ -612,38 +946,40 @@ class TaskManager:
                     if error:
                         print(f"Error: {error}")
                     else:
-                        task.name = new_name
-                        self.tasks_sheet.update_cell(
-                            int(task.task_id) + 1, 2, new_name)
+                        task.update(name=new_name)
+                        self._update_cell(
+                            task_row, 2, new_name)
                         print("Task name updated successfully!")
                         break
 
             elif loaded_choice == "2":  # Update Deadline
                 while True:
-                    new_deadline = input(
-                        "Enter the new deadline (YYYY-MM-DD): ").strip()
+                    new_deadline = input(_NEW_DEADLINE_PROMPT).strip()
                     error = self.validate_deadline(new_deadline)
                     if error:
                         print(f"Error: {error}")
                     else:
-                        task.deadline = new_deadline
-                        self.tasks_sheet.update_cell(
-                            int(task.task_id) + 1, 4, new_deadline)
+                        # Re-insert so the deadline index stays sorted
+                        self._by_deadline.remove(task)
+                        task.update(deadline=new_deadline)
+                        bisect.insort(
+                            self._by_deadline, task, key=_deadline_key)
+                        self._update_cell(
+                            task_row, 4, new_deadline)
                         print("Task deadline updated successfully!")
                         break
 
             elif loaded_choice == "3":  # Update Priority
                 while True:
                     new_priority = input(
-                        "Enter the new priority (High, Medium, Low): "
-                        ).strip().capitalize()
+                        _NEW_PRIORITY_PROMPT).strip().capitalize()
                     error = self.validate_priority(new_priority)
                     if error:
                         print(f"Error: {error}")
                     else:
-                        task.priority = new_priority
-                        self.tasks_sheet.update_cell(
-                            int(task.task_id) + 1, 7, new_priority)
+                        task.update(priority=new_priority)
+                        self._update_cell(
+                            task_row, 7, new_priority)
                         print("Task priority updated successfully!")
                         break
 
@@ -669,37 +1005,28 @@ class TaskManager:
                         new_notes = new_notes[:250]
 
                     # Update the task and the sheet
-                    task.notes = new_notes
-                    self.tasks_sheet.update_cell(
-                        int(task.task_id) + 1, 10, new_notes)
+                    task.update(notes=new_notes)
+                    self._update_cell(
+                        task_row, 10, new_notes)
                     print("Task notes updated successfully!")
                     break
 
             elif loaded_choice == "5":  # Update Status
                 while True:
-                    new_status = input(
-                        "Enter the new status (Pending, In Progress, \
-                            Completed): ").strip()
-                    if new_status not in [
-                            "Pending", "In Progress", "Completed"
-                            ]:
-                        print(
-                            "Invalid status. Please choose from Pending, \
-                                In Progress, or Completed.")
+                    new_status = input(_NEW_STATUS_PROMPT).strip()
+                    if new_status not in _VALID_STATUSES:
+                        print(_INVALID_STATUS_MESSAGE)
                     else:
-                        task.status = new_status
-                        self.tasks_sheet.update_cell(
-                            int(task.task_id) + 1, 6, new_status)
+                        task.update(status=new_status)
+                        self._update_cell(
+                            task_row, 6, new_status)
                         print("Task status updated successfully!")
                         break
 
             elif loaded_choice == "6":  # Update Category
                 # Display available categories
                 print("Available categories:")
-                category_data = self.categories_sheet.get_all_values()[
-                    1:]  # Skip header row
-                for row in category_data:
-                    print(f"ID: {row[0]}, Name: {row[1]}")
+                print(self._category_options)
 
                 # Prompt the user to select a new category
                 while True:
@@ -709,23 +1036,18 @@ class TaskManager:
                     if error:
                         print(f"Error: {error}")
                     else:
-                        new_category_name = self.get_category_name(
-                            new_category_id)
-                        task.category = {"id": new_category_id,
-                                         "name": new_category_name}
+                        task.update(category=self.get_category_ref(
+                            new_category_id))
                         # Update category in Google Sheet
-                        self.tasks_sheet.update_cell(
-                            int(task.task_id) + 1, 8, new_category_id)
+                        self._update_cell(
+                            task_row, 8, new_category_id)
                         print("Task category updated successfully!")
                         break
 
             elif loaded_choice == "7":  # Update Project
                 # Display available projects
                 print("Available projects:")
-                project_data = self.projects_sheet.get_all_values()[
-                    1:]  # Skip header row
-                for row in project_data:
-                    print(f"ID: {row[0]}, Name: {row[1]}")
+                print(self._project_options)
 
                 # Prompt the user to select a new project
                 while True:
@@ -735,13 +1057,11 @@ class TaskManager:
                     if error:
                         print(f"Error: {error}")
                     else:
-                        new_project_name = self.get_project_name(
-                            new_project_id)
-                        task.project = {"id": new_project_id,
-                                        "name": new_project_name}
+                        task.update(project=self.get_project_ref(
+                            new_project_id))
                         # Update project in Google Sheet
-                        self.tasks_sheet.update_cell(
-                            int(task.task_id) + 1, 9, new_project_id)
+                        self._update_cell(
+                            task_row, 9, new_project_id)
                         print("Task project updated successfully!")
                         break
 
@@ -766,20 +1086,20 @@ class TaskManager:
         headers = self.cached_tasks[0]  # Header row
         tasks_data = self.cached_tasks[1:]  # Task rows
 
-        # Filter out 'Completed' tasks
-        visible_tasks = [
-            task for task in tasks_data if task[5].lower() != "deleted"
-            ]
+        # Filter out 'Deleted' tasks lazily while printing
+        visible_tasks = (
+            task for task in tasks_data if task[5].lower() != "deleted")
 
         # Display tasks to help the user choose
-        print("\n--- Mark a Task as Deleted ---")
-        print("Available Tasks:")
-        for task in visible_tasks:
-            try:
-                print(f"ID: {task[0]}, Name: {task[1]}, Status: {task[5]}")
-            except IndexError:
-                print("Error: Task structure is incorrect.")
-                return
+        try:
+            write_lines([
+                "\n--- Mark a Task as Deleted ---",
+                "Available Tasks:",
+                *(f"ID: {task[0]}, Name: {task[1]}, Status: {task[5]}"
+                  for task in visible_tasks)])
+        except IndexError:
+            print("Error: Task structure is incorrect.")
+            return
 
         # Get Task ID or cancel option from the user
         while True:
@@ -788,44 +1108,38 @@ class TaskManager:
                 "or type 'cancel' or 'x' "
                 "to return to the main menu: ").strip()
             # Check for cancel input
-            if task_id.lower() == "cancel" or task_id.lower() == "x":
+            if task_id.lower() in ("cancel", "x"):
                 print("Task deletion canceled. Returning to the main menu...")
                 return  # Exit the delete task method
-            # elif task_id.lower() == "x":
 
             # Find the task in cached data
-            task_to_update = next(
-                (task for task in tasks_data if str(task[0]) == task_id), None)
+            task_row = self._task_rows.get(task_id)
 
-            if not task_to_update:
+            if not task_row:
                 print("Task ID not found. Please try again.")
             else:
+                task_to_update = self.cached_tasks[task_row - 1]
                 break  # Exit the input loop if the task is found
 
         # Update the status of the task in the cached data
         try:
             # Find the column index for the "Status" field
-            col_index = headers.index("status")
-            # Update the cached task's status
-            task_to_update[col_index] = "Deleted"
+            status_col_index = headers.index("status")
         except ValueError:
             print("Error: 'Status' column not found in headers.")
             return
 
         try:
-            # Update the status in cached data
-            status_col_index = self.cached_tasks[0].index("status")
+            # Update the cached task's status
             task_to_update[status_col_index] = "Deleted"
 
             # Update Google Sheets
-            row_index = self.cached_tasks.index(task_to_update)
-            self.tasks_sheet.update_cell(
-                row_index + 1, status_col_index + 1, "Deleted"
+            self._update_cell(
+                task_row, status_col_index + 1, "Deleted"
                 )
 
             # Refresh cached data and in-memory tasks
-            self.load_and_cache_data()  # Refresh cached data
-            self.task_list = self.load_tasks()  # Refresh in-memory tasks
+            self.refresh_data()
 
             print(f"Task '{task_to_update[1]}' has been marked as 'Deleted'.")
         except Exception as e:
@@ -840,25 +1154,31 @@ class TaskManager:
             return
 
         # Display tasks to help the user choose
-        print("\n--- Mark a Task as Completed ---")
-        print("Available Tasks:")
-        for task in self.task_list:
-            if task.status != "Completed":  # Only show incomplete tasks
-                print(
-                    f"ID: {task.task_id},"
-                    f"Name: {task.name},"
-                    f"Status: {task.status}"
-                    )
-
-        # Get Task ID from the user
-        task_id = input(
-            "Enter the ID of the task you want to mark as completed: ").strip()
-        task = next((t for t in self.task_list if str(
-            t.task_id) == task_id), None)
+        write_lines([
+            "\n--- Mark a Task as Completed ---",
+            "Available Tasks:",
+            *(f"ID: {task.task_id},"
+              f"Name: {task.name},"
+              f"Status: {task.status}"
+              for task in self.task_list
+              if task.status != "Completed")])  # Only show incomplete tasks
 
-        if not task:
-            print("Task ID not found. Please try again.")
-            return
+        # Get Task ID or cancel option from the user
+        while True:
+            task_id = input(
+                "Enter the ID of the task you want to mark as completed, "
+                "or type 'cancel' or 'x' "
+                "to return to the main menu: ").strip()
+            # Check for cancel input
+            if task_id.lower() in ("cancel", "x"):
+                print("Task completion canceled. "
+                      "Returning to the main menu...")
+                return
+            task = self._tasks_by_id.get(task_id)
+            if not task:
+                print("Task ID not found. Please try again.")
+            else:
+                break
 
         if task.status == "Completed":
             print(f"Task '{task.name}' is already marked as completed.")
@@ -867,24 +1187,32 @@ class TaskManager:
         # Update the task's status and completion date
         task.mark_as_completed()
 
-        # Update the Google Sheet
-        task_row = int(task.task_id) + 1  # Account for header row
-        self.tasks_sheet.update_cell(
-            task_row, 6, "Completed")  # Update Status column
-        # Update Complete Date column
-        self.tasks_sheet.update_cell(task_row, 5, task.complete_date)
+        # Update the Status and Complete Date columns in a single request
+        task_row = self._task_rows[task.task_id]
+        self._batch_update([
+            {"range": rowcol_to_a1(task_row, 6),
+             "values": [["Completed"]]},
+            {"range": rowcol_to_a1(task_row, 5),
+             "values": [[task.complete_date]]},
+        ], value_input_option="USER_ENTERED")
 
         print(
             f"Task '{task.name}' has been marked as completed successfully!")
 
 
+# Menu choices that read or change task data
+_DATA_CHOICES = frozenset("12345678")
+
+
 # Initialize the TaskManager
 def main():
     """
     Entry point for the Task Manager application.
     """
     # Initialize the TaskManager
-    manager = TaskManager(task_list, projects, categories)
+    manager = TaskManager(get_worksheet('tasks'),
+                          get_worksheet('project'),
+                          get_worksheet('category'))
 
     welcome_message = '''\n
         Welcome to Python Project Manager!
@@ -903,16 +1231,21 @@ def main():
     option8 = Fore.RED + "8 - Delete (archive) a task" + Style.RESET_ALL + "\n"
     option9 = Fore.BLUE + "9 - Clear screen and redisplay menu" + \
         Style.RESET_ALL + "\n"
-    option10 = Fore.BLUE + "10 - Exit" + Style.RESET_ALL + "\n"
+    option10 = Fore.BLUE + "10 - Refresh data from Google Sheets" + \
+        Style.RESET_ALL + "\n"
+    option11 = Fore.BLUE + "11 - Exit" + Style.RESET_ALL + "\n"
     main_menu = option1 + option2 + option3 + option4 + option5 + \
-        option6 + option7 + option8 + option9 + option10
+        option6 + option7 + option8 + option9 + option10 + option11
 
     print(welcome_message)
     print("\nPlease select an option:")
     print(main_menu)
 
     while True:
-        choice = input("Enter your choice: 1 - 10 (9 - back to menu) ").strip()
+        choice = input("Enter your choice: 1 - 11 (9 - back to menu) ").strip()
+        if choice in _DATA_CHOICES:
+            # Reuse the cached data unless it has expired
+            manager.refresh_if_stale()
         if choice == "1":
             manager.create_task_from_input()
         elif choice == "2":
@@ -935,6 +1268,8 @@ def main():
             print("\nPlease select an option:")
             print(main_menu)
         elif choice == "10":
+            manager.refresh_data()
+        elif choice == "11":
             print("Exiting Task Manager. Goodbye!")
             break
         else: